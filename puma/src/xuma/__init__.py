@@ -9,6 +9,9 @@ __version__ = "0.0.2"
 
 # Protocols
 # Matcher tree
+# Predicate compilation
+from xuma._compile import MAX_COMPILE_NODES, compile_predicate
+
 # Config types — see xuma._config for details
 from xuma._config import (
     ActionConfig,
@@ -28,6 +31,9 @@ from xuma._config import (
     ValueMatchConfig,
     parse_matcher_config,
 )
+
+# Predicate fusion
+from xuma._fuse import fuse_predicate
 from xuma._matcher import (
     MAX_DEPTH,
     Action,
@@ -48,6 +54,7 @@ from xuma._predicate import (
     SinglePredicate,
     and_predicate,
     or_predicate,
+    predicate_cost,
     predicate_depth,
 )
 
@@ -69,11 +76,18 @@ from xuma._registry import (
 
 # Concrete matchers
 from xuma._string_matchers import (
+    AnyExactMatcher,
+    AnyPrefixMatcher,
     ContainsMatcher,
     ExactMatcher,
     PrefixMatcher,
     RegexMatcher,
     SuffixMatcher,
+    contains,
+    exact,
+    prefix,
+    regex,
+    suffix,
 )
 from xuma._types import DataInput, InputMatcher, MatchingData
 
@@ -90,7 +104,11 @@ __all__ = [
     "Predicate",
     "and_predicate",
     "or_predicate",
+    "predicate_cost",
     "predicate_depth",
+    # Predicate compilation
+    "compile_predicate",
+    "MAX_COMPILE_NODES",
     # Matcher
     "Action",
     "NestedMatcher",
@@ -106,6 +124,16 @@ __all__ = [
     "SuffixMatcher",
     "ContainsMatcher",
     "RegexMatcher",
+    # Fused multi-pattern matchers
+    "AnyExactMatcher",
+    "AnyPrefixMatcher",
+    "fuse_predicate",
+    # Interning factories
+    "exact",
+    "prefix",
+    "suffix",
+    "contains",
+    "regex",
     # Config types
     "TypedConfig",
     "BuiltInMatch",
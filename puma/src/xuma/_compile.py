@@ -0,0 +1,132 @@
+"""Predicate compilation — collapse a predicate tree into one closure.
+
+Walking the tree through evaluate() pays a Python frame, attribute
+lookups, and a generator object per compound node. compile_predicate
+instead synthesizes a single boolean expression for the whole tree
+(`and`/`or`/`not` short-circuit natively) and eval()s it into one
+closure, so evaluation runs in a single frame with the extraction and
+match callables pre-bound.
+
+The emitted source contains only generated identifiers — no user input
+ever reaches eval(). Trees larger than MAX_COMPILE_NODES fall back to
+the regular evaluate() walk to keep generated expressions bounded.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, cast
+
+from xuma._predicate import And, Not, Or, SinglePredicate
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from xuma._predicate import Predicate
+
+# Trees beyond this size fall back to the evaluate() walk — the win from
+# a single frame shrinks as the expression grows, and unbounded codegen
+# is not worth the (compile-time) cost.
+MAX_COMPILE_NODES = 64
+
+# Bound on the compiled-closure cache. Compilers build the same trees
+# repeatedly (interned matchers make equality cheap), so equal trees
+# share one closure instead of re-running codegen per FieldMatcher.
+_COMPILE_CACHE_SIZE = 256
+
+
+def compile_predicate[Ctx](p: Predicate[Ctx]) -> Callable[[Any], bool]:
+    """Compile a predicate tree into a single `(ctx) -> bool` closure.
+
+    The closure is semantically identical to `p.evaluate`: children are
+    visited in the same cost-ordered sequence with the same short-circuit
+    behavior, and the None -> false invariant is preserved per leaf.
+
+    Equal trees share one compiled closure via a bounded cache (tree
+    hashes are precomputed at construction, so lookups are cheap); trees
+    holding unhashable custom inputs or matchers compile uncached.
+
+    Trees with more than MAX_COMPILE_NODES nodes return the bound
+    `p.evaluate` unchanged.
+    """
+    try:
+        return _compile_cached(p)
+    except TypeError:
+        return _compile(p)
+
+
+@lru_cache(maxsize=_COMPILE_CACHE_SIZE)
+def _compile_cached(p: Predicate[Any]) -> Callable[[Any], bool]:
+    return _compile(p)
+
+
+def _compile(p: Predicate[Any]) -> Callable[[Any], bool]:
+    if _node_count(p) > MAX_COMPILE_NODES:
+        return p.evaluate
+
+    bindings: dict[str, Any] = {}
+    expr = _emit(p, bindings)
+    code = f"lambda ctx: {expr}"
+    # Evaluate with an empty builtins namespace — the expression uses only
+    # the pre-bound names in `bindings` and keyword constants.
+    return cast(
+        "Callable[[Any], bool]",
+        eval(code, {"__builtins__": {}, **bindings}),  # noqa: S307
+    )
+
+
+def _emit_single(p: SinglePredicate[Any], bindings: dict[str, Any]) -> str:
+    i = len(bindings) // 2
+    get, match_, value = f"_g{i}", f"_m{i}", f"_v{i}"
+    bindings[get] = p._get
+    bindings[match_] = p._match
+    # INV: None -> false, evaluated via walrus to avoid a helper frame.
+    return f"(({value} := {get}(ctx)) is not None and {match_}({value}))"
+
+
+def _emit_and(p: And[Any], bindings: dict[str, Any]) -> str:
+    if not p._ordered:
+        return "True"  # vacuous truth
+    return "(" + " and ".join(_emit(sub, bindings) for sub in p._ordered) + ")"
+
+
+def _emit_or(p: Or[Any], bindings: dict[str, Any]) -> str:
+    if not p._ordered:
+        return "False"
+    return "(" + " or ".join(_emit(sub, bindings) for sub in p._ordered) + ")"
+
+
+def _emit_not(p: Not[Any], bindings: dict[str, Any]) -> str:
+    return f"(not {_emit(p.predicate, bindings)})"
+
+
+# type(p)-keyed dispatch — one hash lookup per node instead of the
+# isinstance chain match/case compiles to.
+_EMIT_HANDLERS: dict[type, Callable[[Any, dict[str, Any]], str]] = {
+    SinglePredicate: _emit_single,
+    And: _emit_and,
+    Or: _emit_or,
+    Not: _emit_not,
+}
+
+_COUNT_HANDLERS: dict[type, Callable[[Any], int]] = {
+    SinglePredicate: lambda p: 1,
+    And: lambda p: 1 + sum(_node_count(sub) for sub in p.predicates),
+    Or: lambda p: 1 + sum(_node_count(sub) for sub in p.predicates),
+    Not: lambda p: 1 + _node_count(p.predicate),
+}
+
+
+def _emit(p: Predicate[Any], bindings: dict[str, Any]) -> str:
+    """Emit the boolean expression for a subtree, binding callables by name."""
+    handler = _EMIT_HANDLERS.get(type(p))
+    if handler is None:  # pragma: no cover
+        msg = f"cannot compile predicate node: {type(p).__name__}"
+        raise TypeError(msg)
+    return handler(p, bindings)
+
+
+def _node_count(p: Predicate[Any]) -> int:
+    """Count the nodes in a predicate tree."""
+    handler = _COUNT_HANDLERS.get(type(p))
+    return 1 if handler is None else handler(p)
@@ -0,0 +1,67 @@
+"""Optional delegation to the xuma-crust native extension.
+
+puma is the pure-Python implementation; xuma-crust (PyO3 bindings to the
+rumi engine) is the project's native-speed path. When both are installed,
+setting ``XUMA_USE_CRUST=1`` lets the built-in string matchers delegate
+their hot ``matches`` call to the Rust implementation while keeping their
+Python dataclass identity (repr, equality, config round-tripping).
+
+Delegation is strictly best-effort — the pure-Python path is always the
+fallback and always correct:
+
+- the env flag is off by default;
+- if the extension is missing, the matcher keeps its Python path;
+- if the installed ``StringMatch`` does not expose an evaluable
+  ``matches`` API (config-only builds), the matcher keeps its Python path;
+- case-insensitive matchers never delegate — the crust ``StringMatch``
+  has no ignore_case variant.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_ENV_FLAG = "XUMA_USE_CRUST"
+
+# Constructor names on xuma_crust.StringMatch, one per built-in matcher.
+_KINDS = frozenset({"exact", "prefix", "suffix", "contains", "regex"})
+
+
+def _load_string_match() -> type | None:
+    """Resolve xuma_crust.StringMatch if delegation is enabled and usable."""
+    if os.environ.get(_ENV_FLAG) != "1":
+        return None
+    try:
+        # Optional extension — untyped from this package's point of view.
+        from xuma_crust import StringMatch  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    # The crust must expose an evaluable API; config-only builds carry
+    # the constructors but no `matches` method.
+    if not callable(getattr(StringMatch, "matches", None)):
+        return None
+    return cast("type", StringMatch)
+
+
+# Resolved once at import — the flag is a process-level switch, not a
+# per-matcher one. Tests monkeypatch this to exercise the delegation path.
+_STRING_MATCH = _load_string_match()
+
+
+def crust_matches(kind: str, pattern: str) -> Callable[[str], bool] | None:
+    """Bind a Rust-backed ``matches`` callable for a built-in matcher.
+
+    Returns None when delegation is disabled or unavailable — callers
+    keep their pure-Python path.
+    """
+    if _STRING_MATCH is None or kind not in _KINDS:
+        return None
+    try:
+        rust = getattr(_STRING_MATCH, kind)(pattern)
+    except (TypeError, ValueError):
+        return None  # pattern the crust rejects — pure Python handles it
+    return cast("Callable[[str], bool]", rust.matches)
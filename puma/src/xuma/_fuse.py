@@ -0,0 +1,101 @@
+"""Predicate fusion — collapse Or-chains of same-input string matchers.
+
+The Gateway compiler emits Or(SinglePredicate(PathInput, m1), ...,
+SinglePredicate(PathInput, mN)) for route sets; evaluating each child
+independently is O(N) per request. fuse_predicate groups Or children
+that share a DataInput, matcher kind, and case mode, and replaces each
+group with one fused matcher (see AnyExactMatcher / AnyPrefixMatcher) —
+O(1) for exact groups, O(len(value)) for prefix groups, regardless of N.
+
+Fusion is a compile-time transform: apply it once after building a
+predicate tree, before wrapping it in a Matcher.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from xuma._predicate import And, Not, Or, Predicate, SinglePredicate
+from xuma._string_matchers import (
+    AnyExactMatcher,
+    AnyPrefixMatcher,
+    ExactMatcher,
+    PrefixMatcher,
+)
+
+# Matcher kinds that fuse, mapped to (pattern attribute, fused class).
+_FUSABLE: dict[type, tuple[str, type]] = {
+    ExactMatcher: ("value", AnyExactMatcher),
+    PrefixMatcher: ("prefix", AnyPrefixMatcher),
+}
+
+
+def fuse_predicate[Ctx](p: Predicate[Ctx]) -> Predicate[Ctx]:
+    """Fuse same-input exact/prefix groups inside Or nodes of a tree.
+
+    Returns a semantically equivalent predicate; the input tree is not
+    modified. Children that cannot fuse (different inputs, matcher kinds,
+    case modes, or unhashable inputs) are preserved as-is.
+    """
+    match p:
+        case Or():
+            return _fuse_or(p)
+        case And(predicates=ps):
+            fused = tuple(fuse_predicate(sub) for sub in ps)
+            return p if fused == ps else And(fused)
+        case Not(predicate=inner):
+            fused_inner = fuse_predicate(inner)
+            return p if fused_inner == inner else Not(fused_inner)
+        case _:
+            return p
+
+
+def _fuse_or[Ctx](p: Or[Ctx]) -> Predicate[Ctx]:
+    """Fuse the children of a single Or node."""
+    children = [fuse_predicate(sub) for sub in p.predicates]
+
+    # Group fusable SinglePredicates by (input, matcher kind, case mode).
+    groups: dict[Any, list[SinglePredicate[Ctx]]] = {}
+    for child in children:
+        key = _group_key(child)
+        if key is not None:
+            groups.setdefault(key, []).append(child)  # type: ignore[arg-type]
+
+    if not any(len(g) > 1 for g in groups.values()):
+        return p if children == list(p.predicates) else Or(tuple(children))
+
+    # Rebuild in first-appearance order, emitting each fused group once.
+    out: list[Predicate[Ctx]] = []
+    emitted: set[Any] = set()
+    for child in children:
+        key = _group_key(child)
+        group = groups.get(key) if key is not None else None
+        if key is None or group is None or len(group) == 1:
+            out.append(child)
+            continue
+        if key in emitted:
+            continue
+        emitted.add(key)
+        _, _, attr, fused_cls = key
+        patterns = tuple(getattr(sp.matcher, attr) for sp in group)
+        ignore_case = group[0].matcher.ignore_case  # type: ignore[attr-defined]
+        out.append(SinglePredicate(group[0].input, fused_cls(patterns, ignore_case)))
+
+    if len(out) == 1:
+        return out[0]
+    return Or(tuple(out))
+
+
+def _group_key(p: Predicate[Any]) -> tuple[Any, ...] | None:
+    """Grouping key for a fusable child, or None if it cannot fuse."""
+    if type(p) is not SinglePredicate:
+        return None
+    fusable = _FUSABLE.get(type(p.matcher))
+    if fusable is None:
+        return None
+    attr, fused_cls = fusable
+    try:
+        hash(p.input)
+    except TypeError:
+        return None
+    return (p.input, p.matcher.ignore_case, attr, fused_cls)  # type: ignore[attr-defined]
@@ -9,11 +9,15 @@ Mirrors rumi's Matcher<Ctx, A> with the same xDS evaluation semantics:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
+from xuma._compile import compile_predicate
 from xuma._predicate import Predicate, predicate_depth
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 MAX_DEPTH = 32
 
 
@@ -52,10 +56,18 @@ class FieldMatcher[Ctx, A]:
     """Pairs a predicate with an OnMatch outcome.
 
     If the predicate evaluates to True, the OnMatch is consulted.
+
+    The predicate tree is compiled into a single closure at construction
+    (see xuma._compile); Matcher.evaluate calls the closure instead of
+    walking the tree.
     """
 
     predicate: Predicate[Ctx]
     on_match: OnMatch[Ctx, A]
+    _evaluate: Callable[[Any], bool] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_evaluate", compile_predicate(self.predicate))
 
 
 @dataclass(frozen=True, slots=True)
@@ -85,7 +97,7 @@ class Matcher[Ctx, A]:
         there is no on_no_match fallback.
         """
         for fm in self.matcher_list:
-            if fm.predicate.evaluate(ctx):
+            if fm._evaluate(ctx):
                 result = _evaluate_on_match(fm.on_match, ctx)
                 if result is not None:
                     return result
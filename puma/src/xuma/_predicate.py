@@ -8,11 +8,32 @@ The Predicate union type is pattern-matchable via match/case.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import as_completed
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from xuma._types import DataInput, InputMatcher
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Executor
+
+    from xuma._types import DataInput, InputMatcher, MatchingData
+
+# Cost assumed for matchers that do not advertise a `match_cost` attribute.
+# Sits between the built-in string comparisons and regex search.
+_DEFAULT_MATCH_COST = 2
+
+# evaluate_parallel falls back to sequential evaluate() below these:
+# fan-out overhead swamps small trees and CPU-trivial matchers.
+_MIN_PARALLEL_CHILDREN = 4
+_MIN_PARALLEL_COST = 2
+
+
+def _try_hash(key: tuple[Any, ...]) -> int | None:
+    """Precompute a hash at construction, or None for unhashable parts."""
+    try:
+        return hash(key)
+    except TypeError:
+        return None
 
 
 @dataclass(frozen=True, slots=True)
@@ -21,16 +42,53 @@ class SinglePredicate[Ctx]:
 
     Enforces the None -> false invariant: if the DataInput returns None,
     the predicate evaluates to False without consulting the matcher.
+
+    The extract and match callables are bound once at construction, so
+    evaluate() makes two local calls instead of paying an attribute
+    lookup pair per invocation. Inputs that expose as_callable() (see
+    DataInput) contribute a pre-bound C-level extractor instead of their
+    Python get method.
     """
 
     input: DataInput[Ctx]
     matcher: InputMatcher
+    _get: Callable[[Any], MatchingData] = field(init=False, repr=False, compare=False)
+    _match: Callable[[MatchingData], bool] = field(init=False, repr=False, compare=False)
+    _hash: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        as_callable = getattr(self.input, "as_callable", None)
+        object.__setattr__(
+            self, "_get", self.input.get if as_callable is None else as_callable()
+        )
+        object.__setattr__(self, "_match", self.matcher.matches)
+        object.__setattr__(
+            self, "_hash", _try_hash((SinglePredicate, self.input, self.matcher))
+        )
+
+    def __hash__(self) -> int:
+        # Predicates are dict/lru_cache keys in the compile and fuse
+        # paths; the hash is precomputed at construction. None marks an
+        # unhashable input/matcher — hash on demand so the TypeError
+        # surfaces at the call site, as with the generated __hash__.
+        h = self._hash
+        return hash((SinglePredicate, self.input, self.matcher)) if h is None else h
 
     def evaluate(self, ctx: Any) -> bool:
-        value = self.input.get(ctx)
+        value = self._get(ctx)
         if value is None:
             return False  # INV: None -> false (Dijkstra)
-        return self.matcher.matches(value)
+        return self._match(value)
+
+    def evaluate_batch(self, contexts: Sequence[Any]) -> list[bool]:
+        """Evaluate against many contexts in one call.
+
+        Hoists the extract/match callables out of the loop — one Python
+        call into the predicate for the whole batch.
+        """
+        get = self._get
+        match = self._match
+        return [(v := get(ctx)) is not None and match(v) for ctx in contexts]
 
 
 @dataclass(frozen=True, slots=True)
@@ -38,12 +96,88 @@ class And[Ctx]:
     """All predicates must match (logical AND).
 
     Short-circuits on the first False. Empty And returns True (vacuous truth).
+
+    Construction flattens directly nested And children (AND is associative,
+    so And(And(a, b), c) and And(a, b, c) are equivalent) and drops
+    duplicate children, first occurrence winning — evaluating a duplicate
+    can never change an AND result.
+
+    Evaluation visits children cheapest-first (see predicate_cost) to
+    maximize short-circuit wins; `predicates` keeps the author-given order
+    (after flattening and dedup) and remains authoritative for equality
+    and repr.
     """
 
     predicates: tuple[Predicate[Ctx], ...]
+    _ordered: tuple[Predicate[Ctx], ...] = field(init=False, repr=False, compare=False)
+    _hash: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "predicates", _dedupe(_flatten(self.predicates, And)))
+        object.__setattr__(
+            self, "_ordered", tuple(sorted(self.predicates, key=predicate_cost))
+        )
+        object.__setattr__(self, "_hash", _try_hash((And, self.predicates)))
+
+    def __hash__(self) -> int:
+        h = self._hash
+        return hash((And, self.predicates)) if h is None else h
 
     def evaluate(self, ctx: Any) -> bool:
-        return all(p.evaluate(ctx) for p in self.predicates)
+        # Plain loop instead of all(...): no generator allocation or
+        # iterator frame per call — measurable on 2-5 child trees.
+        for p in self._ordered:  # noqa: SIM110
+            if not p.evaluate(ctx):
+                return False
+        return True
+
+    def evaluate_batch(self, contexts: Sequence[Any]) -> list[bool]:
+        """Evaluate against many contexts in one call.
+
+        Children run cheapest-first over the shrinking set of contexts
+        still undecided — the batch analogue of short-circuiting: a
+        context eliminated by child k is never shown to child k+1.
+        """
+        n = len(contexts)
+        results = [False] * n
+        pending = list(range(n))
+        for child in self._ordered:
+            if not pending:
+                break
+            sub = child.evaluate_batch([contexts[i] for i in pending])
+            pending = [i for i, ok in zip(pending, sub, strict=True) if ok]
+        for i in pending:
+            results[i] = True
+        return results
+
+    def evaluate_parallel(self, ctx: Any, executor: Executor) -> bool:
+        """Evaluate children concurrently on the given executor.
+
+        For trees whose DataInputs block on IO (DB, cache): matching is
+        pure and children are independent by construction, so they can
+        run in parallel. Completion order replaces evaluation order —
+        the first falsy result decides, and still-pending children are
+        cancelled on the way out.
+
+        Falls back to the sequential evaluate() for small trees and for
+        trees of cost-advertising cheap matchers, where fan-out overhead
+        swamps the work. The cost signal only sees the matcher side
+        (predicate_cost), but custom matchers paired with IO inputs
+        default to mid-cost and therefore qualify.
+        """
+        if len(self._ordered) < _MIN_PARALLEL_CHILDREN:
+            return self.evaluate(ctx)
+        if predicate_cost(self) < _MIN_PARALLEL_COST:
+            return self.evaluate(ctx)
+        futures = [executor.submit(p.evaluate, ctx) for p in self._ordered]
+        try:
+            # all() stops at the first falsy completion — the generator
+            # form short-circuits exactly like an explicit loop, and this
+            # path is IO-bound, so the per-frame cost is irrelevant.
+            return all(fut.result() for fut in as_completed(futures))
+        finally:
+            for fut in futures:
+                fut.cancel()
 
 
 @dataclass(frozen=True, slots=True)
@@ -51,12 +185,63 @@ class Or[Ctx]:
     """Any predicate must match (logical OR).
 
     Short-circuits on the first True. Empty Or returns False.
+
+    Construction flattens directly nested Or children (OR is associative,
+    so Or(Or(a, b), c) and Or(a, b, c) are equivalent) and drops
+    duplicate children, first occurrence winning — evaluating a duplicate
+    can never change an OR result.
+
+    Evaluation visits children cheapest-first (see predicate_cost) to
+    maximize short-circuit wins; `predicates` keeps the author-given order
+    (after flattening and dedup) and remains authoritative for equality
+    and repr.
     """
 
     predicates: tuple[Predicate[Ctx], ...]
+    _ordered: tuple[Predicate[Ctx], ...] = field(init=False, repr=False, compare=False)
+    _hash: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "predicates", _dedupe(_flatten(self.predicates, Or)))
+        object.__setattr__(
+            self, "_ordered", tuple(sorted(self.predicates, key=predicate_cost))
+        )
+        object.__setattr__(self, "_hash", _try_hash((Or, self.predicates)))
+
+    def __hash__(self) -> int:
+        h = self._hash
+        return hash((Or, self.predicates)) if h is None else h
 
     def evaluate(self, ctx: Any) -> bool:
-        return any(p.evaluate(ctx) for p in self.predicates)
+        # Plain loop instead of any(...): no generator allocation or
+        # iterator frame per call — measurable on 2-5 child trees.
+        for p in self._ordered:  # noqa: SIM110
+            if p.evaluate(ctx):
+                return True
+        return False
+
+    def evaluate_batch(self, contexts: Sequence[Any]) -> list[bool]:
+        """Evaluate against many contexts in one call.
+
+        Children run cheapest-first over the shrinking set of contexts
+        still undecided — a context accepted by child k is never shown
+        to child k+1.
+        """
+        n = len(contexts)
+        results = [False] * n
+        pending = list(range(n))
+        for child in self._ordered:
+            if not pending:
+                break
+            sub = child.evaluate_batch([contexts[i] for i in pending])
+            still_pending: list[int] = []
+            for i, ok in zip(pending, sub, strict=True):
+                if ok:
+                    results[i] = True
+                else:
+                    still_pending.append(i)
+            pending = still_pending
+        return results
 
 
 @dataclass(frozen=True, slots=True)
@@ -64,10 +249,22 @@ class Not[Ctx]:
     """Inverts the result of the inner predicate (logical NOT)."""
 
     predicate: Predicate[Ctx]
+    _hash: int | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", _try_hash((Not, self.predicate)))
+
+    def __hash__(self) -> int:
+        h = self._hash
+        return hash((Not, self.predicate)) if h is None else h
 
     def evaluate(self, ctx: Any) -> bool:
         return not self.predicate.evaluate(ctx)
 
+    def evaluate_batch(self, contexts: Sequence[Any]) -> list[bool]:
+        """Evaluate against many contexts in one call."""
+        return [not r for r in self.predicate.evaluate_batch(contexts)]
+
 
 # Union type — the Pythonic way to express Rust's Predicate<Ctx> enum.
 type Predicate[Ctx] = SinglePredicate[Ctx] | And[Ctx] | Or[Ctx] | Not[Ctx]
@@ -107,14 +304,111 @@ def or_predicate[Ctx](
     return Or(tuple(predicates))
 
 
+def _flatten[Ctx](
+    predicates: tuple[Predicate[Ctx], ...], cls: type
+) -> tuple[Predicate[Ctx], ...]:
+    """Merge children of the same compound type into a flat tuple.
+
+    Children were themselves flattened at their own construction, so one
+    level of merging is sufficient.
+    """
+    if not any(type(p) is cls for p in predicates):
+        return predicates
+    flat: list[Predicate[Ctx]] = []
+    for p in predicates:
+        if type(p) is cls:
+            flat.extend(p.predicates)  # type: ignore[union-attr]
+        else:
+            flat.append(p)
+    return tuple(flat)
+
+
+def _dedupe[Ctx](
+    predicates: tuple[Predicate[Ctx], ...],
+) -> tuple[Predicate[Ctx], ...]:
+    """Drop duplicate children, keeping first-appearance order.
+
+    Redundant route specs compile to repeated identical predicates, and
+    evaluating a duplicate can never change an And/Or result. Children
+    holding unhashable custom inputs/matchers are left as-is.
+    """
+    try:
+        unique = tuple(dict.fromkeys(predicates))
+    except TypeError:
+        return predicates
+    return unique if len(unique) < len(predicates) else predicates
+
+
+# Tree-walk dispatch tables. match/case compiles to an isinstance chain —
+# O(cases) per node — where a type(p)-keyed dict is one hash lookup.
+# Unknown node types fall through to each walker's documented default.
+
+_COST_HANDLERS: dict[type, Callable[[Any], int]] = {
+    SinglePredicate: lambda p: int(
+        getattr(p.matcher, "match_cost", _DEFAULT_MATCH_COST)
+    ),
+    And: lambda p: max((predicate_cost(sub) for sub in p.predicates), default=0),
+    Or: lambda p: max((predicate_cost(sub) for sub in p.predicates), default=0),
+    Not: lambda p: predicate_cost(p.predicate),
+}
+
+_CHILDREN_HANDLERS: dict[type, Callable[[Any], tuple[Predicate[Any], ...]]] = {
+    And: lambda p: p.predicates,
+    Or: lambda p: p.predicates,
+    Not: lambda p: (p.predicate,),
+}
+
+# Scores a node over the already-computed depths of its children.
+_DEPTH_HANDLERS: dict[type, Callable[[list[int]], int]] = {
+    SinglePredicate: lambda child_depths: 1,
+    And: lambda child_depths: 1 + max(child_depths, default=0),
+    Or: lambda child_depths: 1 + max(child_depths, default=0),
+    Not: lambda child_depths: 1 + child_depths[0],
+}
+
+
+def predicate_cost(p: Predicate[Any]) -> int:
+    """Estimate the static evaluation cost of a predicate subtree.
+
+    SinglePredicate costs whatever its matcher advertises via the optional
+    `match_cost` attribute (exact=0, prefix/suffix=1, contains=2, regex=4);
+    matchers without one are assumed mid-cost. And/Or cost as much as their
+    most expensive child; Not adds nothing.
+
+    Selectivity is unknowable statically, so cost is the only ordering
+    signal — And and Or both evaluate cheapest-first (a stable sort, so
+    equal-cost children keep the author-given order).
+    """
+    handler = _COST_HANDLERS.get(type(p))
+    return _DEFAULT_MATCH_COST if handler is None else handler(p)
+
+
+def _predicate_children(p: Predicate[Any]) -> tuple[Predicate[Any], ...]:
+    """The direct children of a predicate node (empty for leaves)."""
+    handler = _CHILDREN_HANDLERS.get(type(p))
+    return () if handler is None else handler(p)
+
+
 def predicate_depth(p: Predicate[Any]) -> int:
-    """Calculate the nesting depth of a predicate tree."""
-    match p:
-        case SinglePredicate():
-            return 1
-        case And(predicates=ps) | Or(predicates=ps):
-            return 1 + max((predicate_depth(sub) for sub in ps), default=0)
-        case Not(predicate=inner):
-            return 1 + predicate_depth(inner)
-        case _:  # pragma: no cover
-            return 0
+    """Calculate the nesting depth of a predicate tree.
+
+    Iterative post-order walk with an explicit stack: a node is pushed
+    unexpanded, re-pushed after its children, and scored once every
+    child depth is known. Deep Not/And/Or chains neither hit the
+    interpreter recursion limit nor pay a Python frame per node.
+    """
+    depths: dict[int, int] = {}
+    stack: list[tuple[Predicate[Any], bool]] = [(p, False)]
+    while stack:
+        node, expanded = stack.pop()
+        children = _predicate_children(node)
+        if children and not expanded:
+            stack.append((node, True))
+            stack.extend((c, False) for c in children)
+            continue
+        score = _DEPTH_HANDLERS.get(type(node))
+        if score is None:  # pragma: no cover
+            depths[id(node)] = 0
+            continue
+        depths[id(node)] = score([depths[id(c)] for c in children])
+    return depths[id(p)]
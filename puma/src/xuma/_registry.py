@@ -44,13 +44,7 @@ from xuma._matcher import (
     NestedMatcher,
 )
 from xuma._predicate import And, Not, Or, SinglePredicate
-from xuma._string_matchers import (
-    ContainsMatcher,
-    ExactMatcher,
-    PrefixMatcher,
-    RegexMatcher,
-    SuffixMatcher,
-)
+from xuma._string_matchers import contains, exact, prefix, regex, suffix
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -376,16 +370,16 @@ def _compile_built_in(variant: str, value: str) -> InputMatcher:
 
     match variant:
         case "Exact":
-            return ExactMatcher(value=value)
+            return exact(value)
         case "Prefix":
-            return PrefixMatcher(prefix=value)
+            return prefix(value)
         case "Suffix":
-            return SuffixMatcher(suffix=value)
+            return suffix(value)
         case "Contains":
-            return ContainsMatcher(substring=value)
+            return contains(value)
         case "Regex":
             try:
-                return RegexMatcher(pattern=value)
+                return regex(value)
             except Exception as e:
                 msg = f"invalid regex pattern: {e}"
                 raise InvalidConfigError(msg) from e
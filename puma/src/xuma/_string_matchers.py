@@ -6,20 +6,63 @@ All matchers return False for non-string or None input values.
 Regex uses ``google-re2`` for guaranteed linear-time matching. RE2 does not
 support backreferences or lookahead/lookbehind because they require
 backtracking — patterns using them are rejected at compile time.
+
+Each matcher accepts an opt-in ``cache=True`` flag that memoizes results
+per input value in a bounded lru_cache. Useful for fixture suites and
+other workloads that replay a small set of values; off by default so
+high-cardinality production input doesn't grow resident memory.
 """
 
 from __future__ import annotations
 
+import string
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import re2
 
+from xuma._crust import crust_matches
 from xuma._matcher import MatcherError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from xuma._types import MatchingData
 
+# Precomputed A-Z -> a-z table. str.translate with it is cheaper than
+# casefold(), which walks the full Unicode folding tables on every call.
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Bound on the per-matcher result cache enabled by cache=True.
+_MATCH_CACHE_SIZE = 512
+
+
+def _fold(s: str) -> str:
+    """Case-fold for comparison — translate-table for ASCII, casefold otherwise.
+
+    isascii() is O(1) (CPython caches the flag), so the common ASCII
+    HTTP header/path case never touches the Unicode folding tables.
+    """
+    return s.translate(_ASCII_LOWER) if s.isascii() else s.casefold()
+
+
+def _bind_match(matcher: Any, fast: Callable[[str], bool] | None = None) -> None:
+    """Select a matcher's active evaluator and stash it in the _match slot.
+
+    Crust delegation wins when bound; next a C-level `fast` callable if
+    the matcher has one for its configuration; otherwise the pure-Python
+    _match_value. With cache=True the chosen evaluator is wrapped in a
+    bounded lru_cache keyed on the input value.
+    """
+    if matcher._crust is not None:
+        impl = matcher._crust
+    else:
+        impl = fast if fast is not None else matcher._match_value
+    if matcher.cache:
+        impl = lru_cache(maxsize=_MATCH_CACHE_SIZE)(impl)
+    object.__setattr__(matcher, "_match", impl)
+
 
 @dataclass(frozen=True, slots=True)
 class ExactMatcher:
@@ -27,22 +70,63 @@ class ExactMatcher:
 
     When ignore_case is True, comparison is case-insensitive.
     The comparison value is pre-lowercased at construction time.
+
+    The case-sensitive path is a single C-level `==`. The insensitive
+    path skips casefold() entirely when both sides are ASCII (where
+    lower() and casefold() agree and lengths are 1:1), rejecting on
+    length mismatch before touching the string.
+
+    With XUMA_USE_CRUST=1 and an evaluable xuma-crust install, the
+    case-sensitive path delegates to the Rust engine (see xuma._crust).
     """
 
+    match_cost: ClassVar[int] = 0
+
     value: str
     ignore_case: bool = False
+    cache: bool = False
     _cmp_value: str = field(init=False, repr=False)
+    _ascii: bool = field(init=False, repr=False)
+    _len: int = field(init=False, repr=False)
+    _crust: Callable[[str], bool] | None = field(init=False, repr=False, compare=False)
+    _match: Callable[[str], bool] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         object.__setattr__(
-            self, "_cmp_value", self.value.casefold() if self.ignore_case else self.value
+            self, "_cmp_value", _fold(self.value) if self.ignore_case else self.value
+        )
+        # Matchers are heavily used as dict/lru_cache keys (interning,
+        # codegen, fusion); cache the hash instead of recomputing per lookup.
+        object.__setattr__(
+            self, "_hash", hash((ExactMatcher, self.value, self.ignore_case, self.cache))
+        )
+        object.__setattr__(self, "_ascii", self._cmp_value.isascii())
+        object.__setattr__(self, "_len", len(self._cmp_value))
+        object.__setattr__(
+            self,
+            "_crust",
+            None if self.ignore_case else crust_matches("exact", self.value),
         )
+        # Case-sensitive equality needs no Python frame at all: bind the
+        # comparison value's own C-level __eq__. matches() has already
+        # type-checked, so the result is always a real bool.
+        _bind_match(self, None if self.ignore_case else self._cmp_value.__eq__)
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def matches(self, value: MatchingData, /) -> bool:
-        if not isinstance(value, str):
+        if type(value) is not str:
             return False
-        input_val = value.casefold() if self.ignore_case else value
-        return input_val == self._cmp_value
+        return self._match(value)
+
+    def _match_value(self, value: str, /) -> bool:
+        if not self.ignore_case:
+            return value == self._cmp_value
+        if self._ascii and value.isascii():
+            return len(value) == self._len and value.lower() == self._cmp_value
+        return _fold(value) == self._cmp_value
 
 
 @dataclass(frozen=True, slots=True)
@@ -50,23 +134,58 @@ class PrefixMatcher:
     """String prefix match (startswith).
 
     When ignore_case is True, comparison is case-insensitive.
-    The prefix is pre-lowercased at construction time.
+    The prefix is pre-lowercased at construction time. For ASCII input
+    only the first len(prefix) characters are folded — the value itself
+    is never copied in full.
     """
 
+    match_cost: ClassVar[int] = 1
+
     prefix: str
     ignore_case: bool = False
+    cache: bool = False
     _cmp_prefix: str = field(init=False, repr=False)
+    _len: int = field(init=False, repr=False)
+    _crust: Callable[[str], bool] | None = field(init=False, repr=False, compare=False)
+    _match: Callable[[str], bool] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         object.__setattr__(
-            self, "_cmp_prefix", self.prefix.casefold() if self.ignore_case else self.prefix
+            self, "_cmp_prefix", _fold(self.prefix) if self.ignore_case else self.prefix
         )
+        object.__setattr__(self, "_len", len(self._cmp_prefix))
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((PrefixMatcher, self.prefix, self.ignore_case, self.cache)),
+        )
+        object.__setattr__(
+            self,
+            "_crust",
+            None if self.ignore_case else crust_matches("prefix", self.prefix),
+        )
+        _bind_match(self)
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def matches(self, value: MatchingData, /) -> bool:
-        if not isinstance(value, str):
+        if type(value) is not str:
             return False
-        input_val = value.casefold() if self.ignore_case else value
-        return input_val.startswith(self._cmp_prefix)
+        return self._match(value)
+
+    def _match_value(self, value: str, /) -> bool:
+        if not self.ignore_case:
+            return value.startswith(self._cmp_prefix)
+        if value.isascii():
+            # Folding is 1:1 for ASCII: reject on length, then fold only
+            # the prefix-sized head instead of allocating a full copy.
+            if len(value) < self._len:
+                return False
+            return value[: self._len].translate(_ASCII_LOWER) == self._cmp_prefix
+        # Non-ASCII folding may change lengths — fold the whole value.
+        return value.casefold().startswith(self._cmp_prefix)
 
 
 @dataclass(frozen=True, slots=True)
@@ -74,23 +193,60 @@ class SuffixMatcher:
     """String suffix match (endswith).
 
     When ignore_case is True, comparison is case-insensitive.
-    The suffix is pre-lowercased at construction time.
+    The suffix is pre-lowercased at construction time. For ASCII input
+    only the last len(suffix) characters are folded — the value itself
+    is never copied in full.
     """
 
+    match_cost: ClassVar[int] = 1
+
     suffix: str
     ignore_case: bool = False
+    cache: bool = False
     _cmp_suffix: str = field(init=False, repr=False)
+    _len: int = field(init=False, repr=False)
+    _crust: Callable[[str], bool] | None = field(init=False, repr=False, compare=False)
+    _match: Callable[[str], bool] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         object.__setattr__(
-            self, "_cmp_suffix", self.suffix.casefold() if self.ignore_case else self.suffix
+            self, "_cmp_suffix", _fold(self.suffix) if self.ignore_case else self.suffix
+        )
+        object.__setattr__(self, "_len", len(self._cmp_suffix))
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((SuffixMatcher, self.suffix, self.ignore_case, self.cache)),
         )
+        object.__setattr__(
+            self,
+            "_crust",
+            None if self.ignore_case else crust_matches("suffix", self.suffix),
+        )
+        _bind_match(self)
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def matches(self, value: MatchingData, /) -> bool:
-        if not isinstance(value, str):
+        if type(value) is not str:
             return False
-        input_val = value.casefold() if self.ignore_case else value
-        return input_val.endswith(self._cmp_suffix)
+        return self._match(value)
+
+    def _match_value(self, value: str, /) -> bool:
+        if not self.ignore_case:
+            return value.endswith(self._cmp_suffix)
+        if value.isascii():
+            # Folding is 1:1 for ASCII: reject on length, then fold only
+            # the suffix-sized tail instead of allocating a full copy.
+            if len(value) < self._len:
+                return False
+            if not self._len:
+                return True  # empty suffix matches anything
+            return value[-self._len :].translate(_ASCII_LOWER) == self._cmp_suffix
+        # Non-ASCII folding may change lengths — fold the whole value.
+        return value.casefold().endswith(self._cmp_suffix)
 
 
 @dataclass(frozen=True, slots=True)
@@ -100,24 +256,69 @@ class ContainsMatcher:
     When ignore_case is True, comparison is case-insensitive.
     The substring pattern is pre-lowercased at construction time
     (Knuth optimization: avoid repeated lowercasing of the pattern).
+
+    Insensitive ASCII search is pre-fused into a case-insensitive RE2
+    pattern at construction (the substring is escaped, so no user
+    metacharacters survive) — one pass over the value with no folded
+    copy allocated.
     """
 
+    match_cost: ClassVar[int] = 2
+
     substring: str
     ignore_case: bool = False
+    cache: bool = False
     _cmp_substring: str = field(init=False, repr=False)
+    _len: int = field(init=False, repr=False)
+    _search: Callable[[str], object] | None = field(init=False, repr=False, compare=False)
+    _crust: Callable[[str], bool] | None = field(init=False, repr=False, compare=False)
+    _match: Callable[[str], bool] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         object.__setattr__(
             self,
             "_cmp_substring",
-            self.substring.casefold() if self.ignore_case else self.substring,
+            _fold(self.substring) if self.ignore_case else self.substring,
+        )
+        object.__setattr__(self, "_len", len(self._cmp_substring))
+        search = None
+        if self.ignore_case and self._cmp_substring.isascii():
+            search = re2.compile("(?i)" + re2.escape(self._cmp_substring)).search
+        object.__setattr__(self, "_search", search)
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((ContainsMatcher, self.substring, self.ignore_case, self.cache)),
+        )
+        object.__setattr__(
+            self,
+            "_crust",
+            None if self.ignore_case else crust_matches("contains", self.substring),
         )
+        _bind_match(self)
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def matches(self, value: MatchingData, /) -> bool:
-        if not isinstance(value, str):
+        if type(value) is not str:
             return False
-        input_val = value.casefold() if self.ignore_case else value
-        return self._cmp_substring in input_val
+        return self._match(value)
+
+    def _match_value(self, value: str, /) -> bool:
+        if not self.ignore_case:
+            return self._cmp_substring in value
+        if value.isascii():
+            # Folding is 1:1 for ASCII: reject on length, then search
+            # case-insensitively without allocating a folded copy.
+            if len(value) < self._len:
+                return False
+            if self._search is not None:
+                return self._search(value) is not None
+        # Non-ASCII on either side — fold the whole value for full
+        # Unicode casefold semantics.
+        return self._cmp_substring in _fold(value)
 
 
 @dataclass(frozen=True, slots=True)
@@ -135,8 +336,14 @@ class RegexMatcher:
         MatcherError: If the pattern is not valid RE2 syntax.
     """
 
+    match_cost: ClassVar[int] = 4
+
     pattern: str
+    cache: bool = False
     _compiled: re2.Pattern[str] = field(init=False, repr=False)
+    _crust: Callable[[str], bool] | None = field(init=False, repr=False, compare=False)
+    _match: Callable[[str], bool] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         try:
@@ -145,8 +352,134 @@ class RegexMatcher:
             msg = f'invalid regex pattern "{self.pattern}": {e}'
             raise MatcherError(msg) from e
         object.__setattr__(self, "_compiled", compiled)
+        object.__setattr__(
+            self, "_hash", hash((RegexMatcher, self.pattern, self.cache))
+        )
+        object.__setattr__(self, "_crust", crust_matches("regex", self.pattern))
+        _bind_match(self)
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def matches(self, value: MatchingData, /) -> bool:
-        if not isinstance(value, str):
+        if type(value) is not str:
             return False
+        return self._match(value)
+
+    def _match_value(self, value: str, /) -> bool:
         return self._compiled.search(value) is not None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Fused multi-pattern matchers
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Or-chains of same-input exact/prefix matchers cost O(N) per request.
+# These fused equivalents answer the whole group in one lookup — O(1) for
+# exact sets, O(len(value)) for prefix sets — regardless of group size.
+# They are produced by xuma._fuse.fuse_predicate but usable directly.
+
+
+@dataclass(frozen=True, slots=True)
+class AnyExactMatcher:
+    """Matches when the value equals any one of a set of strings.
+
+    The fused form of Or(ExactMatcher(v1), ..., ExactMatcher(vN)) over a
+    shared input — one frozenset lookup instead of N comparisons.
+    """
+
+    match_cost: ClassVar[int] = 0
+
+    values: tuple[str, ...]
+    ignore_case: bool = False
+    _values: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        folded = (_fold(v) for v in self.values) if self.ignore_case else self.values
+        object.__setattr__(self, "_values", frozenset(folded))
+
+    def matches(self, value: MatchingData, /) -> bool:
+        if type(value) is not str:
+            return False
+        return (_fold(value) if self.ignore_case else value) in self._values
+
+
+@dataclass(frozen=True, slots=True)
+class AnyPrefixMatcher:
+    """Matches when the value starts with any one of a set of prefixes.
+
+    The fused form of Or(PrefixMatcher(p1), ..., PrefixMatcher(pN)) over
+    a shared input. A character trie bounds the walk by the longest
+    prefix — O(len(value)) worst case regardless of group size.
+    """
+
+    match_cost: ClassVar[int] = 1
+
+    values: tuple[str, ...]
+    ignore_case: bool = False
+    # Nested dict trie; the "" key marks a terminal (end of a prefix).
+    _trie: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        trie: dict[str, Any] = {}
+        for v in self.values:
+            node = trie
+            for ch in _fold(v) if self.ignore_case else v:
+                node = node.setdefault(ch, {})
+            node[""] = True
+        object.__setattr__(self, "_trie", trie)
+
+    def matches(self, value: MatchingData, /) -> bool:
+        if type(value) is not str:
+            return False
+        node = self._trie
+        if "" in node:
+            return True  # empty prefix matches anything
+        for ch in _fold(value) if self.ignore_case else value:
+            node = node.get(ch)  # type: ignore[assignment]
+            if node is None:
+                return False
+            if "" in node:
+                return True
+        return False
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Interning factories
+# ═══════════════════════════════════════════════════════════════════════════════
+#
+# Matchers are frozen and immutable, so identical specs can share one
+# instance. Compilers and fixture loaders construct the same handful of
+# matchers over and over (ExactMatcher("GET"), PrefixMatcher("/api"), ...);
+# routing through these factories dedupes the allocations and turns
+# equality on identical predicate trees into pointer comparisons.
+
+
+@lru_cache(maxsize=4096)
+def exact(value: str, ignore_case: bool = False) -> ExactMatcher:
+    """Interned ExactMatcher — identical specs share one instance."""
+    return ExactMatcher(value, ignore_case)
+
+
+@lru_cache(maxsize=4096)
+def prefix(value: str, ignore_case: bool = False) -> PrefixMatcher:
+    """Interned PrefixMatcher — identical specs share one instance."""
+    return PrefixMatcher(value, ignore_case)
+
+
+@lru_cache(maxsize=4096)
+def suffix(value: str, ignore_case: bool = False) -> SuffixMatcher:
+    """Interned SuffixMatcher — identical specs share one instance."""
+    return SuffixMatcher(value, ignore_case)
+
+
+@lru_cache(maxsize=4096)
+def contains(value: str, ignore_case: bool = False) -> ContainsMatcher:
+    """Interned ContainsMatcher — identical specs share one instance."""
+    return ContainsMatcher(value, ignore_case)
+
+
+@lru_cache(maxsize=4096)
+def regex(pattern: str) -> RegexMatcher:
+    """Interned RegexMatcher — identical patterns share one compiled instance."""
+    return RegexMatcher(pattern)
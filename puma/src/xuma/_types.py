@@ -26,6 +26,11 @@ class DataInput(Protocol[Ctx]):
 
     Returning None signals "data not available" and causes the predicate
     to evaluate to False (the None -> false invariant).
+
+    Implementations may additionally expose `as_callable()` returning a
+    pre-bound `(ctx) -> MatchingData` callable equivalent to get — e.g.
+    an operator.attrgetter/methodcaller, which run at C level.
+    SinglePredicate prefers it over the bound get when present.
     """
 
     def get(self, ctx: Ctx, /) -> MatchingData: ...
@@ -38,6 +43,10 @@ class InputMatcher(Protocol):
     InputMatcher is intentionally non-generic — the same ExactMatcher works
     for HTTP, Claude, test contexts, etc. This is the key design insight
     from Envoy's matcher architecture.
+
+    Implementations may additionally expose a `match_cost` class attribute
+    (an int; higher = more expensive) used by And/Or to order children for
+    short-circuit evaluation. Matchers without one are assumed mid-cost.
     """
 
     def matches(self, value: MatchingData, /) -> bool: ...
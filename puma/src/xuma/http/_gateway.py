@@ -9,9 +9,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal
 
+from xuma._fuse import fuse_predicate
 from xuma._matcher import Matcher, matcher_from_predicate
 from xuma._predicate import Predicate, SinglePredicate, and_predicate, or_predicate
-from xuma._string_matchers import ExactMatcher, PrefixMatcher, RegexMatcher
+from xuma._string_matchers import exact, prefix, regex
 from xuma.http._inputs import HeaderInput, MethodInput, PathInput, QueryParamInput
 
 if TYPE_CHECKING:
@@ -20,7 +21,7 @@ if TYPE_CHECKING:
 
 def _catch_all() -> Predicate[HttpRequest]:
     """A catch-all predicate that matches any HTTP request."""
-    return SinglePredicate(PathInput(), PrefixMatcher(""))
+    return SinglePredicate(PathInput(), prefix(""))
 
 
 @dataclass(frozen=True, slots=True)
@@ -74,7 +75,7 @@ class HttpRouteMatch:
             predicates.append(_compile_path_match(self.path))
 
         if self.method is not None:
-            predicates.append(SinglePredicate(MethodInput(), ExactMatcher(self.method)))
+            predicates.append(SinglePredicate(MethodInput(), exact(self.method)))
 
         for header_match in self.headers:
             predicates.append(_compile_header_match(header_match))
@@ -93,10 +94,12 @@ def compile_route_matches[A](
     """Compile multiple HttpRouteMatch entries into a single Matcher.
 
     Multiple matches are ORed together per Gateway API semantics.
+    Same-input exact/prefix groups in the resulting Or are fused into
+    multi-pattern matchers (see xuma._fuse).
     """
     predicates = [m.to_predicate() for m in matches]
     return matcher_from_predicate(
-        or_predicate(predicates, _catch_all()),
+        fuse_predicate(or_predicate(predicates, _catch_all())),
         action,
         on_no_match,
     )
@@ -106,11 +109,11 @@ def _compile_path_match(path_match: HttpPathMatch) -> SinglePredicate[HttpReques
     """Compile a path match to a predicate."""
     match path_match.type:
         case "Exact":
-            return SinglePredicate(PathInput(), ExactMatcher(path_match.value))
+            return SinglePredicate(PathInput(), exact(path_match.value))
         case "PathPrefix":
-            return SinglePredicate(PathInput(), PrefixMatcher(path_match.value))
+            return SinglePredicate(PathInput(), prefix(path_match.value))
         case "RegularExpression":
-            return SinglePredicate(PathInput(), RegexMatcher(path_match.value))
+            return SinglePredicate(PathInput(), regex(path_match.value))
         case _:
             msg = f"Unknown path match type: {path_match.type}"
             raise ValueError(msg)
@@ -121,9 +124,9 @@ def _compile_header_match(header_match: HttpHeaderMatch) -> SinglePredicate[Http
     input_ = HeaderInput(header_match.name)
     match header_match.type:
         case "Exact":
-            return SinglePredicate(input_, ExactMatcher(header_match.value))
+            return SinglePredicate(input_, exact(header_match.value))
         case "RegularExpression":
-            return SinglePredicate(input_, RegexMatcher(header_match.value))
+            return SinglePredicate(input_, regex(header_match.value))
         case _:
             msg = f"Unknown header match type: {header_match.type}"
             raise ValueError(msg)
@@ -134,9 +137,9 @@ def _compile_query_param_match(query_match: HttpQueryParamMatch) -> SinglePredic
     input_ = QueryParamInput(query_match.name)
     match query_match.type:
         case "Exact":
-            return SinglePredicate(input_, ExactMatcher(query_match.value))
+            return SinglePredicate(input_, exact(query_match.value))
         case "RegularExpression":
-            return SinglePredicate(input_, RegexMatcher(query_match.value))
+            return SinglePredicate(input_, regex(query_match.value))
         case _:
             msg = f"Unknown query param match type: {query_match.type}"
             raise ValueError(msg)
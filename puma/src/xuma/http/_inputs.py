@@ -2,14 +2,20 @@
 
 Each input extracts a specific field from an HttpRequest context
 and returns it as a MatchingData for predicate evaluation.
+
+Each also provides as_callable() — an operator.attrgetter/methodcaller
+equivalent of get that runs at C level, preferred by SinglePredicate.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter, methodcaller
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from xuma._types import MatchingData
     from xuma.http._request import HttpRequest
 
@@ -21,6 +27,9 @@ class PathInput:
     def get(self, ctx: HttpRequest, /) -> MatchingData:
         return ctx.path
 
+    def as_callable(self) -> Callable[[HttpRequest], MatchingData]:
+        return attrgetter("path")
+
 
 @dataclass(frozen=True, slots=True)
 class MethodInput:
@@ -29,6 +38,9 @@ class MethodInput:
     def get(self, ctx: HttpRequest, /) -> MatchingData:
         return ctx.method
 
+    def as_callable(self) -> Callable[[HttpRequest], MatchingData]:
+        return attrgetter("method")
+
 
 @dataclass(frozen=True, slots=True)
 class HeaderInput:
@@ -39,6 +51,9 @@ class HeaderInput:
     def get(self, ctx: HttpRequest, /) -> MatchingData:
         return ctx.header(self.name)
 
+    def as_callable(self) -> Callable[[HttpRequest], MatchingData]:
+        return methodcaller("header", self.name)
+
 
 @dataclass(frozen=True, slots=True)
 class QueryParamInput:
@@ -48,3 +63,6 @@ class QueryParamInput:
 
     def get(self, ctx: HttpRequest, /) -> MatchingData:
         return ctx.query_param(self.name)
+
+    def as_callable(self) -> Callable[[HttpRequest], MatchingData]:
+        return methodcaller("query_param", self.name)
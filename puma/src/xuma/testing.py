@@ -10,9 +10,12 @@ For real domains, implement DataInput for your own context type.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import methodcaller
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from xuma._registry import RegistryBuilder
     from xuma._types import MatchingData
 
@@ -36,6 +39,9 @@ class DictInput:
     def get(self, ctx: dict[str, str], /) -> MatchingData:
         return ctx.get(self.key)
 
+    def as_callable(self) -> Callable[[dict[str, str]], MatchingData]:
+        return methodcaller("get", self.key)
+
 
 def register(
     builder: RegistryBuilder[dict[str, str]],
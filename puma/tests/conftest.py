@@ -16,17 +16,17 @@ import yaml
 from xuma import (
     Action,
     And,
-    ContainsMatcher,
-    ExactMatcher,
     FieldMatcher,
     Matcher,
     NestedMatcher,
     Not,
     Or,
-    PrefixMatcher,
-    RegexMatcher,
     SinglePredicate,
-    SuffixMatcher,
+    contains,
+    exact,
+    prefix,
+    regex,
+    suffix,
 )
 from xuma.http import (
     HttpHeaderMatch,
@@ -69,15 +69,15 @@ class HttpFixtureCase:
 def parse_value_match(spec: dict[str, Any]) -> Any:
     """Parse a value_match spec into an InputMatcher."""
     if "exact" in spec:
-        return ExactMatcher(spec["exact"], ignore_case=spec.get("ignore_case", False))
+        return exact(spec["exact"], ignore_case=spec.get("ignore_case", False))
     if "prefix" in spec:
-        return PrefixMatcher(spec["prefix"], ignore_case=spec.get("ignore_case", False))
+        return prefix(spec["prefix"], ignore_case=spec.get("ignore_case", False))
     if "suffix" in spec:
-        return SuffixMatcher(spec["suffix"], ignore_case=spec.get("ignore_case", False))
+        return suffix(spec["suffix"], ignore_case=spec.get("ignore_case", False))
     if "contains" in spec:
-        return ContainsMatcher(spec["contains"], ignore_case=spec.get("ignore_case", False))
+        return contains(spec["contains"], ignore_case=spec.get("ignore_case", False))
     if "regex" in spec:
-        return RegexMatcher(spec["regex"])
+        return regex(spec["regex"])
     msg = f"Unknown value_match type: {spec}"
     raise ValueError(msg)
 
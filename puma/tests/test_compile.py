@@ -0,0 +1,141 @@
+"""Tests for predicate compilation (xuma._compile)."""
+
+from __future__ import annotations
+
+from xuma import (
+    MAX_COMPILE_NODES,
+    And,
+    ExactMatcher,
+    Not,
+    Or,
+    PrefixMatcher,
+    SinglePredicate,
+    compile_predicate,
+)
+from xuma.testing import DictInput
+
+
+class TestCompileSingle:
+    def test_match(self) -> None:
+        f = compile_predicate(SinglePredicate(DictInput("name"), ExactMatcher("alice")))
+        assert f({"name": "alice"}) is True
+
+    def test_no_match(self) -> None:
+        f = compile_predicate(SinglePredicate(DictInput("name"), ExactMatcher("alice")))
+        assert f({"name": "bob"}) is False
+
+    def test_none_returns_false(self) -> None:
+        f = compile_predicate(SinglePredicate(DictInput("missing"), ExactMatcher("alice")))
+        assert f({"name": "alice"}) is False
+
+
+class TestCompileCompound:
+    def test_and(self) -> None:
+        p = And(
+            (
+                SinglePredicate(DictInput("a"), ExactMatcher("1")),
+                SinglePredicate(DictInput("b"), ExactMatcher("2")),
+            )
+        )
+        f = compile_predicate(p)
+        assert f({"a": "1", "b": "2"}) is True
+        assert f({"a": "1", "b": "x"}) is False
+
+    def test_or(self) -> None:
+        p = Or(
+            (
+                SinglePredicate(DictInput("a"), ExactMatcher("1")),
+                SinglePredicate(DictInput("a"), ExactMatcher("2")),
+            )
+        )
+        f = compile_predicate(p)
+        assert f({"a": "2"}) is True
+        assert f({"a": "3"}) is False
+
+    def test_not(self) -> None:
+        f = compile_predicate(Not(SinglePredicate(DictInput("a"), ExactMatcher("1"))))
+        assert f({"a": "1"}) is False
+        assert f({"a": "2"}) is True
+
+    def test_empty_and_returns_true(self) -> None:
+        f = compile_predicate(And(()))
+        assert f({}) is True
+
+    def test_empty_or_returns_false(self) -> None:
+        f = compile_predicate(Or(()))
+        assert f({}) is False
+
+    def test_nested_tree(self) -> None:
+        p = And(
+            (
+                Or(
+                    (
+                        SinglePredicate(DictInput("role"), ExactMatcher("admin")),
+                        SinglePredicate(DictInput("role"), ExactMatcher("superuser")),
+                    )
+                ),
+                Not(SinglePredicate(DictInput("status"), PrefixMatcher("in"))),
+            )
+        )
+        f = compile_predicate(p)
+        assert f({"role": "admin", "status": "active"}) is True
+        assert f({"role": "admin", "status": "inactive"}) is False
+        assert f({"role": "user", "status": "active"}) is False
+
+
+class TestCompileCache:
+    def test_equal_trees_share_one_closure(self) -> None:
+        def build() -> Or[dict[str, str]]:
+            return Or(
+                (
+                    SinglePredicate(DictInput("a"), ExactMatcher("1")),
+                    SinglePredicate(DictInput("b"), PrefixMatcher("2")),
+                )
+            )
+
+        assert compile_predicate(build()) is compile_predicate(build())
+
+    def test_unhashable_tree_compiles_uncached(self) -> None:
+        class UnhashableInput:
+            __hash__ = None  # type: ignore[assignment]
+
+            def get(self, ctx: dict[str, str], /) -> str | None:
+                return ctx.get("a")
+
+        p = SinglePredicate(UnhashableInput(), ExactMatcher("1"))
+        f = compile_predicate(p)
+        assert f({"a": "1"}) is True
+        assert f({"a": "2"}) is False
+
+
+class TestCompileFallback:
+    def test_large_tree_falls_back_to_evaluate(self) -> None:
+        leaves = tuple(
+            SinglePredicate(DictInput(f"k{i}"), ExactMatcher("v"))
+            for i in range(MAX_COMPILE_NODES + 1)
+        )
+        p = Or(leaves)
+        f = compile_predicate(p)
+        assert f == p.evaluate
+        assert f({"k3": "v"}) is True
+
+    def test_compiled_matches_evaluate_on_same_tree(self) -> None:
+        p = Or(
+            (
+                SinglePredicate(DictInput("a"), ExactMatcher("1")),
+                And(
+                    (
+                        SinglePredicate(DictInput("b"), ExactMatcher("2")),
+                        SinglePredicate(DictInput("c"), PrefixMatcher("3")),
+                    )
+                ),
+            )
+        )
+        f = compile_predicate(p)
+        for ctx in (
+            {"a": "1"},
+            {"b": "2", "c": "33"},
+            {"b": "2", "c": "4"},
+            {},
+        ):
+            assert f(ctx) == p.evaluate(ctx)
@@ -0,0 +1,124 @@
+"""Tests for optional xuma-crust delegation (xuma._crust)."""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+from xuma import ExactMatcher, RegexMatcher, _crust
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class _StubStringMatch:
+    """Stands in for an evaluable xuma_crust.StringMatch."""
+
+    calls: list[str] = []
+
+    def __init__(self, kind: str, pattern: str) -> None:
+        self.kind = kind
+        self.pattern = pattern
+
+    @classmethod
+    def exact(cls, pattern: str) -> _StubStringMatch:
+        return cls("exact", pattern)
+
+    @classmethod
+    def prefix(cls, pattern: str) -> _StubStringMatch:
+        return cls("prefix", pattern)
+
+    @classmethod
+    def suffix(cls, pattern: str) -> _StubStringMatch:
+        return cls("suffix", pattern)
+
+    @classmethod
+    def contains(cls, pattern: str) -> _StubStringMatch:
+        return cls("contains", pattern)
+
+    @classmethod
+    def regex(cls, pattern: str) -> _StubStringMatch:
+        return cls("regex", pattern)
+
+    def matches(self, value: str) -> bool:
+        _StubStringMatch.calls.append(value)
+        return value == self.pattern
+
+
+class _ConfigOnlyStringMatch:
+    """Stands in for a config-only build — constructors but no matches()."""
+
+    @classmethod
+    def exact(cls, pattern: str) -> _ConfigOnlyStringMatch:
+        return cls()
+
+
+class TestLoadStringMatch:
+    def test_disabled_without_env_flag(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("XUMA_USE_CRUST", raising=False)
+        assert _crust._load_string_match() is None
+
+    def test_missing_extension_falls_back(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("XUMA_USE_CRUST", "1")
+        monkeypatch.setitem(sys.modules, "xuma_crust", None)  # forces ImportError
+        assert _crust._load_string_match() is None
+
+    def test_config_only_extension_falls_back(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("XUMA_USE_CRUST", "1")
+        fake = type(sys)("xuma_crust")
+        fake.StringMatch = _ConfigOnlyStringMatch
+        monkeypatch.setitem(sys.modules, "xuma_crust", fake)
+        assert _crust._load_string_match() is None
+
+    def test_evaluable_extension_resolves(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("XUMA_USE_CRUST", "1")
+        fake = type(sys)("xuma_crust")
+        fake.StringMatch = _StubStringMatch
+        monkeypatch.setitem(sys.modules, "xuma_crust", fake)
+        assert _crust._load_string_match() is _StubStringMatch
+
+
+class TestCrustDelegation:
+    def test_matcher_delegates_when_available(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_crust, "_STRING_MATCH", _StubStringMatch)
+        _StubStringMatch.calls.clear()
+        m = ExactMatcher("GET")
+        assert m.matches("GET") is True
+        assert m.matches("POST") is False
+        assert _StubStringMatch.calls == ["GET", "POST"]
+
+    def test_ignore_case_never_delegates(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_crust, "_STRING_MATCH", _StubStringMatch)
+        _StubStringMatch.calls.clear()
+        m = ExactMatcher("GET", ignore_case=True)
+        assert m.matches("get") is True
+        assert _StubStringMatch.calls == []
+
+    def test_none_invariant_survives_delegation(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_crust, "_STRING_MATCH", _StubStringMatch)
+        assert ExactMatcher("GET").matches(None) is False
+
+    def test_regex_delegates(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(_crust, "_STRING_MATCH", _StubStringMatch)
+        _StubStringMatch.calls.clear()
+        m = RegexMatcher("^/api$")
+        m.matches("/api/v1")
+        assert _StubStringMatch.calls == ["/api/v1"]
+
+    def test_matchers_keep_pure_python_path_by_default(self) -> None:
+        # Module-level resolution ran with the flag unset, so matchers
+        # built in this suite carry no crust binding.
+        assert ExactMatcher("GET")._crust is None
+        assert RegexMatcher("^a$")._crust is None
@@ -0,0 +1,136 @@
+"""Tests for predicate fusion (xuma._fuse)."""
+
+from __future__ import annotations
+
+from xuma import (
+    And,
+    AnyExactMatcher,
+    AnyPrefixMatcher,
+    Not,
+    Or,
+    SinglePredicate,
+    exact,
+    fuse_predicate,
+    prefix,
+    regex,
+)
+from xuma.testing import DictInput
+
+
+class TestAnyExactMatcher:
+    def test_matches_any_member(self) -> None:
+        m = AnyExactMatcher(("GET", "POST"))
+        assert m.matches("GET") is True
+        assert m.matches("POST") is True
+        assert m.matches("DELETE") is False
+
+    def test_ignore_case(self) -> None:
+        m = AnyExactMatcher(("get", "post"), ignore_case=True)
+        assert m.matches("GET") is True
+        assert m.matches("DELETE") is False
+
+    def test_none_returns_false(self) -> None:
+        assert AnyExactMatcher(("a",)).matches(None) is False
+
+
+class TestAnyPrefixMatcher:
+    def test_matches_any_prefix(self) -> None:
+        m = AnyPrefixMatcher(("/api", "/admin"))
+        assert m.matches("/api/users") is True
+        assert m.matches("/admin") is True
+        assert m.matches("/public") is False
+
+    def test_overlapping_prefixes(self) -> None:
+        m = AnyPrefixMatcher(("/api", "/api/v2"))
+        assert m.matches("/api/v1") is True
+        assert m.matches("/ap") is False
+
+    def test_empty_prefix_matches_anything(self) -> None:
+        m = AnyPrefixMatcher(("",))
+        assert m.matches("anything") is True
+        assert m.matches("") is True
+
+    def test_ignore_case(self) -> None:
+        m = AnyPrefixMatcher(("/API",), ignore_case=True)
+        assert m.matches("/api/users") is True
+
+    def test_none_returns_false(self) -> None:
+        assert AnyPrefixMatcher(("/a",)).matches(None) is False
+
+
+class TestFusePredicate:
+    def test_fuses_exact_group_on_shared_input(self) -> None:
+        p = Or(
+            (
+                SinglePredicate(DictInput("method"), exact("GET")),
+                SinglePredicate(DictInput("method"), exact("POST")),
+            )
+        )
+        fused = fuse_predicate(p)
+        assert fused == SinglePredicate(
+            DictInput("method"), AnyExactMatcher(("GET", "POST"))
+        )
+        assert fused.evaluate({"method": "POST"}) is True
+        assert fused.evaluate({"method": "DELETE"}) is False
+
+    def test_fuses_prefix_group(self) -> None:
+        p = Or(
+            (
+                SinglePredicate(DictInput("path"), prefix("/api")),
+                SinglePredicate(DictInput("path"), prefix("/admin")),
+            )
+        )
+        fused = fuse_predicate(p)
+        assert fused == SinglePredicate(
+            DictInput("path"), AnyPrefixMatcher(("/api", "/admin"))
+        )
+
+    def test_distinct_inputs_do_not_fuse(self) -> None:
+        p = Or(
+            (
+                SinglePredicate(DictInput("a"), exact("1")),
+                SinglePredicate(DictInput("b"), exact("2")),
+            )
+        )
+        assert fuse_predicate(p) == p
+
+    def test_unfusable_children_are_preserved(self) -> None:
+        rx = SinglePredicate(DictInput("path"), regex(r"^/v\d+"))
+        p = Or(
+            (
+                SinglePredicate(DictInput("path"), exact("/a")),
+                SinglePredicate(DictInput("path"), exact("/b")),
+                rx,
+            )
+        )
+        fused = fuse_predicate(p)
+        assert isinstance(fused, Or)
+        assert SinglePredicate(DictInput("path"), AnyExactMatcher(("/a", "/b"))) in (
+            fused.predicates
+        )
+        assert rx in fused.predicates
+
+    def test_fuses_inside_and_and_not(self) -> None:
+        group = Or(
+            (
+                SinglePredicate(DictInput("m"), exact("GET")),
+                SinglePredicate(DictInput("m"), exact("HEAD")),
+            )
+        )
+        other = SinglePredicate(DictInput("x"), exact("1"))
+        fused = fuse_predicate(And((group, Not(group), other)))
+        expected_leaf = SinglePredicate(DictInput("m"), AnyExactMatcher(("GET", "HEAD")))
+        assert fused == And((expected_leaf, Not(expected_leaf), other))
+
+    def test_equivalent_to_unfused_evaluation(self) -> None:
+        p = Or(
+            (
+                SinglePredicate(DictInput("path"), prefix("/api")),
+                SinglePredicate(DictInput("path"), prefix("/admin")),
+                SinglePredicate(DictInput("path"), exact("/health")),
+            )
+        )
+        fused = fuse_predicate(p)
+        for path in ("/api/users", "/admin", "/health", "/healthz", "/other", ""):
+            ctx = {"path": path}
+            assert fused.evaluate(ctx) == p.evaluate(ctx)
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from operator import methodcaller
+
+import pytest
+
 from xuma import (
     And,
+    ContainsMatcher,
     ExactMatcher,
     Not,
     Or,
+    Predicate,
+    PrefixMatcher,
+    RegexMatcher,
     SinglePredicate,
+    predicate_cost,
     predicate_depth,
 )
 from xuma.testing import DictInput
@@ -27,6 +37,23 @@ class TestSinglePredicate:
         assert p.evaluate({"name": "alice"}) is False
 
 
+class TestAsCallable:
+    def test_single_predicate_prefers_as_callable(self) -> None:
+        p = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        assert isinstance(p._get, methodcaller)
+        assert p.evaluate({"a": "1"}) is True
+
+    def test_input_without_as_callable_falls_back_to_get(self) -> None:
+        class PlainInput:
+            def get(self, ctx: dict[str, str], /) -> str | None:
+                return ctx.get("a")
+
+        plain = PlainInput()
+        p = SinglePredicate(plain, ExactMatcher("1"))
+        assert p._get == plain.get
+        assert p.evaluate({"a": "1"}) is True
+
+
 class TestAnd:
     def test_all_true(self) -> None:
         p = And(
@@ -85,6 +112,235 @@ class TestNot:
         assert p.evaluate({"a": "1"}) is True
 
 
+class TestFlattening:
+    def test_and_of_and_is_flattened(self) -> None:
+        a = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        b = SinglePredicate(DictInput("b"), ExactMatcher("2"))
+        c = SinglePredicate(DictInput("c"), ExactMatcher("3"))
+        p = And((And((a, b)), c))
+        assert p.predicates == (a, b, c)
+        assert p == And((a, b, c))
+        assert p.evaluate({"a": "1", "b": "2", "c": "3"}) is True
+
+    def test_or_of_or_is_flattened(self) -> None:
+        a = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        b = SinglePredicate(DictInput("a"), ExactMatcher("2"))
+        c = SinglePredicate(DictInput("a"), ExactMatcher("3"))
+        p = Or((Or((a, b)), c))
+        assert p.predicates == (a, b, c)
+        assert p.evaluate({"a": "2"}) is True
+
+    def test_heterogeneous_nesting_is_preserved(self) -> None:
+        a = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        b = SinglePredicate(DictInput("b"), ExactMatcher("2"))
+        inner = Or((a, b))
+        p = And((inner, a))
+        assert p.predicates == (inner, a)
+
+    def test_flattening_reduces_depth(self) -> None:
+        a = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        p = And((And((And((a,)),)),))
+        assert predicate_depth(p) == 2
+
+
+class TestDeduplication:
+    def test_and_drops_duplicate_children(self) -> None:
+        a = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        b = SinglePredicate(DictInput("b"), ExactMatcher("2"))
+        p = And((a, b, SinglePredicate(DictInput("a"), ExactMatcher("1"))))
+        assert p.predicates == (a, b)
+        assert p.evaluate({"a": "1", "b": "2"}) is True
+
+    def test_or_drops_duplicate_children(self) -> None:
+        a = SinglePredicate(DictInput("m"), ExactMatcher("GET"))
+        p = Or((a, a, SinglePredicate(DictInput("m"), ExactMatcher("GET"))))
+        assert p.predicates == (a,)
+        assert p.evaluate({"m": "GET"}) is True
+
+    def test_distinct_children_are_untouched(self) -> None:
+        a = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        b = SinglePredicate(DictInput("a"), ExactMatcher("2"))
+        assert Or((a, b)).predicates == (a, b)
+
+    def test_dedupe_applies_after_flattening(self) -> None:
+        a = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        b = SinglePredicate(DictInput("b"), ExactMatcher("2"))
+        assert And((And((a, b)), a)).predicates == (a, b)
+
+    def test_unhashable_children_are_preserved(self) -> None:
+        class UnhashableInput:
+            __hash__ = None  # type: ignore[assignment]
+
+            def get(self, ctx: dict[str, str], /) -> str | None:
+                return ctx.get("a")
+
+        child = SinglePredicate(UnhashableInput(), ExactMatcher("1"))
+        p = And((child, child))
+        assert p.predicates == (child, child)
+        assert p.evaluate({"a": "1"}) is True
+
+
+class TestSelectivityOrdering:
+    def test_predicate_cost_ranks_matchers(self) -> None:
+        exact = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        prefix = SinglePredicate(DictInput("a"), PrefixMatcher("1"))
+        contains = SinglePredicate(DictInput("a"), ContainsMatcher("1"))
+        regex = SinglePredicate(DictInput("a"), RegexMatcher("1"))
+        assert predicate_cost(exact) < predicate_cost(prefix)
+        assert predicate_cost(prefix) < predicate_cost(contains)
+        assert predicate_cost(contains) < predicate_cost(regex)
+
+    def test_compound_cost_is_max_of_children(self) -> None:
+        exact = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        regex = SinglePredicate(DictInput("a"), RegexMatcher("1"))
+        assert predicate_cost(And((exact, regex))) == predicate_cost(regex)
+        assert predicate_cost(Not(regex)) == predicate_cost(regex)
+
+    def test_and_evaluates_cheapest_first(self) -> None:
+        regex = SinglePredicate(DictInput("a"), RegexMatcher("^1$"))
+        exact = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        p = And((regex, exact))
+        assert p.predicates == (regex, exact)  # author order preserved
+        assert p._ordered == (exact, regex)  # evaluation order is cheap-first
+        assert p.evaluate({"a": "1"}) is True
+
+    def test_or_evaluates_cheapest_first(self) -> None:
+        regex = SinglePredicate(DictInput("a"), RegexMatcher("^1$"))
+        exact = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        p = Or((regex, exact))
+        assert p.predicates == (regex, exact)
+        assert p._ordered == (exact, regex)
+        assert p.evaluate({"a": "2"}) is False
+
+    def test_equal_cost_children_keep_author_order(self) -> None:
+        first = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        second = SinglePredicate(DictInput("b"), ExactMatcher("2"))
+        p = And((first, second))
+        assert p._ordered == (first, second)
+
+
+class TestEvaluateBatch:
+    def test_single_batch_matches_scalar(self) -> None:
+        p = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        ctxs = [{"a": "1"}, {"a": "2"}, {}, {"a": "1"}]
+        assert p.evaluate_batch(ctxs) == [p.evaluate(c) for c in ctxs]
+
+    def test_and_batch_matches_scalar(self) -> None:
+        p = And(
+            (
+                SinglePredicate(DictInput("a"), ExactMatcher("1")),
+                SinglePredicate(DictInput("b"), PrefixMatcher("2")),
+            )
+        )
+        ctxs = [{"a": "1", "b": "22"}, {"a": "1", "b": "3"}, {"a": "x", "b": "22"}, {}]
+        assert p.evaluate_batch(ctxs) == [p.evaluate(c) for c in ctxs]
+
+    def test_or_batch_matches_scalar(self) -> None:
+        p = Or(
+            (
+                SinglePredicate(DictInput("a"), ExactMatcher("1")),
+                SinglePredicate(DictInput("a"), ExactMatcher("2")),
+            )
+        )
+        ctxs = [{"a": "1"}, {"a": "2"}, {"a": "3"}, {}]
+        assert p.evaluate_batch(ctxs) == [p.evaluate(c) for c in ctxs]
+
+    def test_not_batch_matches_scalar(self) -> None:
+        p = Not(SinglePredicate(DictInput("a"), ExactMatcher("1")))
+        ctxs = [{"a": "1"}, {"a": "2"}, {}]
+        assert p.evaluate_batch(ctxs) == [p.evaluate(c) for c in ctxs]
+
+    def test_empty_compound_batches(self) -> None:
+        and_empty: And[dict[str, str]] = And(())
+        or_empty: Or[dict[str, str]] = Or(())
+        assert and_empty.evaluate_batch([{}, {}]) == [True, True]
+        assert or_empty.evaluate_batch([{}, {}]) == [False, False]
+
+    def test_empty_context_list(self) -> None:
+        p = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        assert p.evaluate_batch([]) == []
+
+
+class _RefusingExecutor:
+    """Fails the test if the fallback path submits anything."""
+
+    def submit(self, fn: object, /, *args: object) -> object:
+        msg = "evaluate_parallel should not have fanned out"
+        raise AssertionError(msg)
+
+
+class TestEvaluateParallel:
+    def _wide_and(self) -> And[dict[str, str]]:
+        return And(
+            tuple(
+                SinglePredicate(DictInput(k), RegexMatcher("^1$"))
+                for k in ("a", "b", "c", "d")
+            )
+        )
+
+    def test_matches_sequential_results(self) -> None:
+        p = self._wide_and()
+        ctxs = [
+            {"a": "1", "b": "1", "c": "1", "d": "1"},
+            {"a": "1", "b": "1", "c": "1", "d": "2"},
+            {},
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for ctx in ctxs:
+                assert p.evaluate_parallel(ctx, executor) == p.evaluate(ctx)
+
+    def test_small_tree_falls_back_without_submitting(self) -> None:
+        p = And(
+            (
+                SinglePredicate(DictInput("a"), RegexMatcher("^1$")),
+                SinglePredicate(DictInput("b"), RegexMatcher("^1$")),
+            )
+        )
+        assert p.evaluate_parallel({"a": "1", "b": "1"}, _RefusingExecutor()) is True
+
+    def test_cheap_tree_falls_back_without_submitting(self) -> None:
+        p = And(
+            tuple(
+                SinglePredicate(DictInput(k), ExactMatcher("1"))
+                for k in ("a", "b", "c", "d")
+            )
+        )
+        ctx = {"a": "1", "b": "1", "c": "1", "d": "1"}
+        assert p.evaluate_parallel(ctx, _RefusingExecutor()) is True
+
+
+class TestHashCaching:
+    def test_equal_trees_hash_equal(self) -> None:
+        def build() -> And[dict[str, str]]:
+            return And(
+                (
+                    SinglePredicate(DictInput("a"), ExactMatcher("1")),
+                    Not(SinglePredicate(DictInput("b"), ExactMatcher("2"))),
+                )
+            )
+
+        assert build() == build()
+        assert hash(build()) == hash(build())
+
+    def test_hash_is_precomputed(self) -> None:
+        p = SinglePredicate(DictInput("a"), ExactMatcher("1"))
+        assert p._hash == hash(p)
+        assert And((p,))._hash == hash(And((p,)))
+
+    def test_unhashable_input_raises_on_demand(self) -> None:
+        class UnhashableInput:
+            __hash__ = None  # type: ignore[assignment]
+
+            def get(self, ctx: dict[str, str], /) -> str | None:
+                return ctx.get("a")
+
+        p = SinglePredicate(UnhashableInput(), ExactMatcher("1"))
+        assert p.evaluate({"a": "1"}) is True  # construction + eval still work
+        assert p._hash is None
+        with pytest.raises(TypeError):
+            hash(p)
+
+
 class TestPredicateDepth:
     def test_single_depth(self) -> None:
         p = SinglePredicate(DictInput("a"), ExactMatcher("1"))
@@ -97,3 +353,12 @@ class TestPredicateDepth:
     def test_nested_depth(self) -> None:
         p = Not(And((SinglePredicate(DictInput("a"), ExactMatcher("1")),)))
         assert predicate_depth(p) == 3
+
+    def test_deep_chain_exceeds_recursion_limit(self) -> None:
+        # Iterative walk — no RecursionError on pathologically deep trees.
+        p: Predicate[dict[str, str]] = SinglePredicate(
+            DictInput("a"), ExactMatcher("1")
+        )
+        for _ in range(5000):
+            p = Not(p)
+        assert predicate_depth(p) == 5001
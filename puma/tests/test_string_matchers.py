@@ -9,6 +9,11 @@ from xuma import (
     PrefixMatcher,
     RegexMatcher,
     SuffixMatcher,
+    contains,
+    exact,
+    prefix,
+    regex,
+    suffix,
 )
 
 
@@ -48,6 +53,18 @@ class TestExactMatcher:
         m = ExactMatcher("hello")
         assert m.matches("hello world") is False
 
+    def test_ignore_case_length_mismatch(self) -> None:
+        m = ExactMatcher("hello", ignore_case=True)
+        assert m.matches("HELLO!") is False
+        assert m.matches("HELL") is False
+
+    def test_ignore_case_non_ascii_folding(self) -> None:
+        # casefold() expands ß to ss — the ASCII fast path must not
+        # change full-Unicode semantics.
+        m = ExactMatcher("straße", ignore_case=True)
+        assert m.matches("STRASSE") is True
+        assert m.matches("STRAßE") is True
+
 
 class TestPrefixMatcher:
     def test_prefix_match(self) -> None:
@@ -140,3 +157,109 @@ class TestRegexMatcher:
         """RE2 rejects backreferences — this is what the migration prevents."""
         with pytest.raises(MatcherError):
             RegexMatcher(r"(a)\1")
+
+
+class TestInterningFactories:
+    def test_exact_interns_identical_specs(self) -> None:
+        assert exact("GET") is exact("GET")
+        assert exact("GET") == ExactMatcher("GET")
+
+    def test_distinct_specs_are_distinct(self) -> None:
+        assert exact("GET") is not exact("POST")
+        assert exact("get") is not exact("get", ignore_case=True)
+
+    def test_all_factories_intern(self) -> None:
+        assert prefix("/api") is prefix("/api")
+        assert suffix(".json") is suffix(".json")
+        assert contains("admin") is contains("admin")
+        assert regex(r"\d+") is regex(r"\d+")
+
+    def test_regex_factory_propagates_errors(self) -> None:
+        with pytest.raises(MatcherError):
+            regex(r"[invalid")
+
+
+class TestIgnoreCaseFusedPaths:
+    def test_contains_fused_search_escapes_metacharacters(self) -> None:
+        m = ContainsMatcher("a+b", ignore_case=True)
+        assert m.matches("xA+By") is True
+        assert m.matches("xaab") is False
+
+    def test_contains_ignore_case_long_value(self) -> None:
+        m = ContainsMatcher("NeEdLe", ignore_case=True)
+        assert m.matches("x" * 100 + "needle" + "y" * 100) is True
+        assert m.matches("x" * 100) is False
+
+    def test_prefix_ignore_case_shorter_value(self) -> None:
+        m = PrefixMatcher("/api/v1", ignore_case=True)
+        assert m.matches("/API") is False
+        assert m.matches("/API/V1/users") is True
+
+    def test_suffix_ignore_case_shorter_value(self) -> None:
+        m = SuffixMatcher(".json", ignore_case=True)
+        assert m.matches(".js") is False
+        assert m.matches("DATA.JSON") is True
+
+    def test_empty_ignore_case_patterns(self) -> None:
+        assert PrefixMatcher("", ignore_case=True).matches("anything") is True
+        assert SuffixMatcher("", ignore_case=True).matches("anything") is True
+        assert ContainsMatcher("", ignore_case=True).matches("anything") is True
+
+
+class TestResultCache:
+    def test_cached_results_match_uncached(self) -> None:
+        values = ["GET", "get", "POST", "", "/api/v1", None, 7]
+        pairs = [
+            (ExactMatcher("GET"), ExactMatcher("GET", cache=True)),
+            (PrefixMatcher("/api"), PrefixMatcher("/api", cache=True)),
+            (SuffixMatcher(".json"), SuffixMatcher(".json", cache=True)),
+            (ContainsMatcher("api"), ContainsMatcher("api", cache=True)),
+            (RegexMatcher("^GET$"), RegexMatcher("^GET$", cache=True)),
+        ]
+        for plain, cached in pairs:
+            for v in values:
+                assert cached.matches(v) == plain.matches(v)
+
+    def test_cache_records_hits_on_repeats(self) -> None:
+        m = RegexMatcher(r"^/api/v\d+$", cache=True)
+        for _ in range(3):
+            m.matches("/api/v1")
+        info = m._match.cache_info()
+        assert info.hits == 2
+        assert info.misses == 1
+
+    def test_cache_is_off_by_default(self) -> None:
+        m = ExactMatcher("GET")
+        assert not hasattr(m._match, "cache_info")
+
+
+class TestExactFastPath:
+    def test_case_sensitive_binds_c_level_eq(self) -> None:
+        m = ExactMatcher("GET")
+        assert m._match == m._cmp_value.__eq__
+
+    def test_ignore_case_keeps_python_path(self) -> None:
+        m = ExactMatcher("GET", ignore_case=True)
+        assert m._match == m._match_value
+
+
+class TestHashCaching:
+    def test_hash_is_precomputed_and_stable(self) -> None:
+        for m in (
+            ExactMatcher("GET"),
+            PrefixMatcher("/api"),
+            SuffixMatcher(".json"),
+            ContainsMatcher("admin"),
+            RegexMatcher(r"\d+"),
+        ):
+            assert hash(m) == m._hash
+
+    def test_equal_matchers_hash_equal(self) -> None:
+        assert hash(ExactMatcher("GET")) == hash(ExactMatcher("GET"))
+        assert hash(PrefixMatcher("/a", ignore_case=True)) == hash(
+            PrefixMatcher("/a", ignore_case=True)
+        )
+
+    def test_hash_distinguishes_flags(self) -> None:
+        assert hash(ExactMatcher("a")) != hash(ExactMatcher("a", ignore_case=True))
+        assert hash(ExactMatcher("a")) != hash(ExactMatcher("a", cache=True))